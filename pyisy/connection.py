@@ -133,7 +133,7 @@ class Connection:
         """Compile the URL to fetch from the ISY."""
         url = self.url
         if path is not None:
-            url += "/rest/" + "/".join([quote(item) for item in path])
+            url = f"{url}/rest/{'/'.join(map(quote, path))}"
 
         if query is not None:
             url += "?" + urlencode(query)
@@ -108,6 +108,8 @@ TAG_NTP = "NTP"
 TAG_PARENT = "parent"
 TAG_PARAMETER = "parameter"
 TAG_PRGM_FINISH = "f"
+TAG_PRGM_OFF = "off"
+TAG_PRGM_ON = "on"
 TAG_PRGM_RUN = "r"
 TAG_PRGM_RUNNING = "running"
 TAG_PRGM_STATUS = "s"
@@ -1,7 +1,16 @@
 """Exceptions used by the PyISY module."""
+from xml.etree.ElementTree import ParseError
 from xml.parsers.expat import ExpatError
 
-XML_ERRORS = (AttributeError, KeyError, ValueError, TypeError, IndexError, ExpatError)
+XML_ERRORS = (
+    AttributeError,
+    KeyError,
+    ValueError,
+    TypeError,
+    IndexError,
+    ExpatError,
+    ParseError,
+)
 XML_PARSE_ERROR = "ISY Could not parse response, poorly formatted XML."
 
 
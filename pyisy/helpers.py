@@ -1,10 +1,14 @@
 """Helper functions for the PyISY Module."""
 from __future__ import annotations
 
+import asyncio
 from collections.abc import Callable
-from dataclasses import dataclass, is_dataclass
+from dataclasses import MISSING, dataclass, is_dataclass
 import datetime
+from functools import lru_cache
+import re
 import time
+from xml.etree import ElementTree
 
 from .constants import (
     ATTR_FORMATTED,
@@ -30,13 +34,20 @@ from .constants import (
 from .exceptions import XML_ERRORS
 from .logging import _LOGGER
 
+# A status response consisting of a single, entity-free <property/> element.
+STATUS_PROPERTY_REGEX = re.compile(
+    r'\s*(?:<\?xml[^>]*\?>)?\s*<property((?:\s+\w+="[^"&<]*")*)\s*/>\s*'
+)
+ATTRIBUTE_REGEX = re.compile(r'(\w+)="([^"]*)"')
+
 
 def parse_xml_properties(xmldoc):
     """
     Parse the xml properties string.
 
     Args:
-        xmldoc: xml document to parse
+        xmldoc: xml document to parse, either a minidom document/element or
+            an ElementTree element.
 
     Returns:
         (state_val, state_uom, state_prec, aux_props)
@@ -46,26 +57,17 @@ def parse_xml_properties(xmldoc):
     state_set = False
     state = NodeProperty(PROP_STATUS, uom=ISY_PROP_NOT_SET)
 
-    props = xmldoc.getElementsByTagName(TAG_PROPERTY)
-    if not props:
-        return state, aux_props, state_set
+    if isinstance(xmldoc, ElementTree.Element):
+        props = xmldoc.iter(TAG_PROPERTY)
+        get_attr = ElementTree.Element.get
+    else:
+        props = xmldoc.getElementsByTagName(TAG_PROPERTY)
+        get_attr = attr_from_element
 
     for prop in props:
-        prop_id = attr_from_element(prop, ATTR_ID)
-        uom = attr_from_element(prop, ATTR_UNIT_OF_MEASURE, DEFAULT_UNIT_OF_MEASURE)
-        value = attr_from_element(prop, ATTR_VALUE, "").strip()
-        prec = attr_from_element(prop, ATTR_PRECISION, DEFAULT_PRECISION)
-        formatted = attr_from_element(prop, ATTR_FORMATTED, value)
-
-        # ISY firmwares < 5 return a list of possible units.
-        # ISYv5+ returns a UOM string which is checked against the SDK.
-        # Only return a list if the UOM should be a list.
-        if "/" in uom and uom != "n/a":
-            uom = uom.split("/")
-
-        value = int(value) if value.strip() != "" else ISY_VALUE_UNKNOWN
-
-        result = NodeProperty(prop_id, value, prec, uom, formatted)
+        result = property_from_element(prop, get_attr)
+        prop_id = result.control
+        value = result.value
 
         if prop_id == PROP_STATUS:
             state = result
@@ -81,6 +83,58 @@ def parse_xml_properties(xmldoc):
     return state, aux_props, state_set
 
 
+def parse_status_property(xml):
+    """
+    Parse a status response containing only a single property.
+
+    This avoids building an XML tree for the common `/get/ST` response.
+
+    Returns:
+        NodeProperty for the status, or None if the response is not a lone
+        status property and must be parsed as a full XML document.
+
+    """
+    if not xml or (attrs := status_property_attributes(xml)) is None:
+        return None
+    return property_from_element(dict(attrs), dict.get)
+
+
+@lru_cache(maxsize=256)
+def status_property_attributes(xml):
+    """
+    Extract the attributes of a lone status property response.
+
+    Nodes report the same few states repeatedly, so matches are cached. The
+    attributes are returned as an immutable tuple of pairs so a cached result
+    cannot be changed by a caller.
+    """
+    if not (match := STATUS_PROPERTY_REGEX.fullmatch(xml)):
+        return None
+    attrs = tuple(ATTRIBUTE_REGEX.findall(match.group(1)))
+    if dict(attrs).get(ATTR_ID) != PROP_STATUS:
+        return None
+    return attrs
+
+
+def property_from_element(prop, get_attr):
+    """Create a NodeProperty from a property element's attributes."""
+    prop_id = get_attr(prop, ATTR_ID)
+    uom = get_attr(prop, ATTR_UNIT_OF_MEASURE, DEFAULT_UNIT_OF_MEASURE)
+    value = get_attr(prop, ATTR_VALUE, "").strip()
+    prec = get_attr(prop, ATTR_PRECISION, DEFAULT_PRECISION)
+    formatted = get_attr(prop, ATTR_FORMATTED, value)
+
+    # ISY firmwares < 5 return a list of possible units.
+    # ISYv5+ returns a UOM string which is checked against the SDK.
+    # Only return a list if the UOM should be a list.
+    if "/" in uom and uom != "n/a":
+        uom = uom.split("/")
+
+    value = int(value) if value else ISY_VALUE_UNKNOWN
+
+    return NodeProperty(prop_id, value, prec, uom, formatted)
+
+
 def value_from_xml(xml, tag_name, default=None):
     """Extract a value from the XML element."""
     value = default
@@ -104,10 +158,9 @@ def attr_from_xml(xml, tag_name, attr_name, default=None):
 
 def attr_from_element(element, attr_name, default=None):
     """Extract an attribute value from an XML element."""
-    value = default
-    if attr_name in element.attributes.keys():
-        value = element.attributes[attr_name].value
-    return value
+    if (attr := element.getAttributeNode(attr_name)) is None:
+        return default
+    return attr.value
 
 
 def value_from_nested_xml(base, chain, default=None):
@@ -164,11 +217,13 @@ def now():
 class EventEmitter:
     """Event Emitter class."""
 
-    _subscribers: list[EventListener]
+    __slots__ = ("_subscribers",)
+
+    _subscribers: dict[int, EventListener]
 
     def __init__(self):
         """Initialize a new Event Emitter class."""
-        self._subscribers = []
+        self._subscribers = {}
 
     def subscribe(
         self, callback: Callable, event_filter: dict | str = None, key: str = None
@@ -177,21 +232,25 @@ class EventEmitter:
         listener = EventListener(
             emitter=self, callback=callback, event_filter=event_filter, key=key
         )
-        self._subscribers.append(listener)
+        self._subscribers[id(listener)] = listener
         return listener
 
     def unsubscribe(self, listener):
         """Unsubscribe from the events."""
-        self._subscribers.remove(listener)
+        self._subscribers.pop(id(listener), None)
 
     def notify(self, event):
         """Notify a listener."""
-        for subscriber in self._subscribers:
+        # Iterate a snapshot, callbacks may subscribe or unsubscribe.
+        for subscriber in list(self._subscribers.values()):
             # Guard against downstream errors interrupting the socket connection (#249)
             try:
                 if e_filter := subscriber.event_filter:
                     if is_dataclass(event) and isinstance(e_filter, dict):
-                        if not (e_filter.items() <= event.__dict__.items()):
+                        if any(
+                            getattr(event, key, MISSING) != value
+                            for key, value in e_filter.items()
+                        ):
                             continue
                     elif event != e_filter:
                         continue
@@ -208,6 +267,8 @@ class EventEmitter:
 class EventListener:
     """Event Listener class."""
 
+    __slots__ = ("emitter", "callback", "event_filter", "key")
+
     emitter: EventEmitter
     callback: Callable
     event_filter: dict | str
@@ -218,6 +279,51 @@ class EventListener:
         self.emitter.unsubscribe(self)
 
 
+class CoalescedUpdate:
+    """
+    Share one delayed fetch between the callers that ask for it.
+
+    Callers that arrive while the fetch is still waiting out its wait_time
+    join it. Once the request is about to be sent, the next caller starts a
+    new fetch so it never receives a reply older than its own call.
+    """
+
+    __slots__ = ("_fetch", "_pending", "_task")
+
+    def __init__(self, fetch: Callable):
+        """Initialize a coalesced update around a fetch coroutine function."""
+        self._fetch = fetch
+        self._pending = False
+        self._task = None
+
+    @property
+    def pending(self):
+        """Return if a fetch is waiting and can still be joined."""
+        return self._pending
+
+    async def run(self, wait_time=0):
+        """Run the fetch after wait_time, or join the one that is waiting."""
+        if not self._pending:
+            self._pending = True
+            self._task = asyncio.create_task(self._wait_and_fetch(wait_time))
+            self._task.add_done_callback(self._release)
+        return await asyncio.shield(self._task)
+
+    async def _wait_and_fetch(self, wait_time):
+        """Wait out the joining window, then fetch."""
+        try:
+            if wait_time:
+                await asyncio.sleep(wait_time)
+        finally:
+            self._pending = False
+        return await self._fetch()
+
+    def _release(self, task):
+        """Drop the finished task so its result isn't kept around."""
+        if self._task is task:
+            self._task = None
+
+
 @dataclass
 class NodeProperty:
     """Class to hold result of a control event or node aux property."""
@@ -73,8 +73,9 @@ class NodeServers:
     async def load_node_servers(self):
         """Load information about node servers from the ISY."""
 
-        await self.get_connection_info()
-        await self.get_node_server_profiles()
+        await asyncio.gather(
+            self.get_connection_info(), self.get_node_server_profiles()
+        )
         for slot in self._slots:
             await self.parse_node_server_defs(slot)
         self.loaded = True
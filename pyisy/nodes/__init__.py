@@ -2,7 +2,9 @@
 from asyncio import sleep
 from dataclasses import dataclass
 import re
+import sys
 from xml.dom import minidom
+from xml.etree import ElementTree
 
 from ..constants import (
     ATTR_ACTION,
@@ -93,6 +95,8 @@ class Nodes:
     |  nobjs: [optional] list of node objects
     |  ntypes: [optional] list of node types
     |  xml: [optional] String of xml data containing the configuration data
+    |  address_index: [keyword only] Map of addresses to list positions,
+                      shared with the folder views.
 
     :ivar all_lower_nodes: Return all nodes beneath current level
     :ivar children: A list of the object's children.
@@ -110,6 +114,8 @@ class Nodes:
         nobjs=None,
         ntypes=None,
         xml=None,
+        *,
+        address_index=None,
     ):
         """Initialize the Nodes ISY Node Manager class."""
         self.isy = isy
@@ -120,6 +126,9 @@ class Nodes:
         self.nparents = []
         self.nobjs = []
         self.ntypes = []
+        self._address_index = {}
+        self._controller_groups = {}
+        self._member_groups = {}
 
         self.status_events = EventEmitter()
 
@@ -132,6 +141,11 @@ class Nodes:
         self.nparents = nparents
         self.nobjs = nobjs
         self.ntypes = ntypes
+        if address_index is not None:
+            self._address_index = address_index
+        else:
+            for i, address in enumerate(addresses or ()):
+                self._address_index.setdefault(address, i)
 
     def __str__(self):
         """Return string representation of the nodes/folders/groups."""
@@ -360,13 +374,17 @@ class Nodes:
             _LOGGER.error("%s: Nodes", XML_PARSE_ERROR)
             raise ISYResponseParseError(XML_PARSE_ERROR) from exc
 
-        # get nodes
-        ntypes = [TAG_FOLDER, TAG_NODE, TAG_GROUP]
-        node_servers = []
-        for ntype in ntypes:
-            features = xmldoc.getElementsByTagName(ntype)
+        # Sort the document's elements by type in a single walk, then load
+        # folders, nodes and groups in that order so group members exist.
+        features = {TAG_FOLDER: [], TAG_NODE: [], TAG_GROUP: []}
+        for feature in xmldoc.getElementsByTagName("*"):
+            if feature.tagName in features:
+                features[feature.tagName].append(feature)
+        index = self._address_index
 
-            for feature in features:
+        node_servers = []
+        for ntype, ntype_features in features.items():
+            for feature in ntype_features:
                 # Get Node Information
                 address = value_from_xml(feature, TAG_ADDRESS)
                 nname = value_from_xml(feature, TAG_NAME)
@@ -403,37 +421,33 @@ class Nodes:
                             node_servers.append(node_server)
 
                 # Process the different node types
-                if ntype == TAG_FOLDER and address not in self.addresses:
+                if ntype == TAG_FOLDER and address not in index:
                     self.insert(address, nname, nparent, None, ntype)
                 elif ntype == TAG_NODE:
-                    if address in self.addresses:
-                        self.get_by_id(address).update(xmldoc=feature)
+                    if (i := index.get(address)) is not None:
+                        if isinstance(node := self.nobjs[i], Node):
+                            node.update_from_xml(feature)
                         continue
                     state, aux_props, state_set = parse_xml_properties(feature)
-                    self.insert(
-                        address,
-                        nname,
-                        nparent,
-                        Node(
-                            self,
-                            address=address,
-                            name=nname,
-                            state=state,
-                            aux_properties=aux_props,
-                            zwave_props=zwave_props,
-                            node_def_id=node_def_id,
-                            pnode=pnode,
-                            device_type=device_type,
-                            enabled=enabled,
-                            node_server=node_server,
-                            protocol=protocol,
-                            family_id=family,
-                            state_set=state_set,
-                            flag=flag,
-                        ),
-                        ntype,
+                    node = Node(
+                        self,
+                        address=address,
+                        name=nname,
+                        state=state,
+                        aux_properties=aux_props,
+                        zwave_props=zwave_props,
+                        node_def_id=node_def_id,
+                        pnode=pnode,
+                        device_type=device_type,
+                        enabled=enabled,
+                        node_server=node_server,
+                        protocol=protocol,
+                        family_id=family,
+                        state_set=state_set,
+                        flag=flag,
                     )
-                elif ntype == TAG_GROUP and address not in self.addresses:
+                    self.insert(address, nname, nparent, node, ntype)
+                elif ntype == TAG_GROUP and address not in index:
                     # Ignore groups that contain 0x08 in the flag since
                     # that is a ISY scene that contains every device/
                     # scene so it will contain some scenes we have not
@@ -454,22 +468,17 @@ class Nodes:
                             == NODE_IS_CONTROLLER
                         ):
                             controllers.append(mem.firstChild.nodeValue)
-                    self.insert(
-                        address,
-                        nname,
-                        nparent,
-                        Group(
-                            self,
-                            address=address,
-                            name=nname,
-                            members=members,
-                            controllers=controllers,
-                            family_id=family,
-                            pnode=pnode,
-                            flag=flag,
-                        ),
-                        ntype,
+                    group = Group(
+                        self,
+                        address=address,
+                        name=nname,
+                        members=members,
+                        controllers=controllers,
+                        family_id=family,
+                        pnode=pnode,
+                        flag=flag,
                     )
+                    self.insert(address, nname, nparent, group, ntype)
             _LOGGER.debug("ISY Loaded %s", ntype)
         if self.isy.node_servers is None:
             self.isy.node_servers = NodeServers(self.isy, set(node_servers))
@@ -492,18 +501,18 @@ class Nodes:
             _LOGGER.warning("ISY Failed to update nodes.")
             return
 
+        # One status document covers every node, dispatch each by address.
         try:
-            xmldoc = minidom.parseString(xml)
-        except XML_ERRORS:
+            xmldoc = ElementTree.fromstring(xml)
+        except ElementTree.ParseError:
             _LOGGER.error("%s: Nodes", XML_PARSE_ERROR)
             return False
 
-        for feature in xmldoc.getElementsByTagName(TAG_NODE):
-            address = feature.attributes[ATTR_ID].value
-
-            if address in self.addresses:
-                await self.get_by_id(address).update(xmldoc=feature)
-                continue
+        index = self._address_index
+        for feature in xmldoc.iter(TAG_NODE):
+            i = index.get(feature.get(ATTR_ID))
+            if i is not None and self.ntypes[i] == TAG_NODE:
+                self.nobjs[i].update_from_xml(feature)
 
         _LOGGER.info("ISY Updated Node Statuses.")
 
@@ -533,18 +542,26 @@ class Nodes:
         |  nobj: node object
         |  ntype: node type
         """
+        address = sys.intern(address)
+        self._address_index.setdefault(address, len(self.addresses))
         self.addresses.append(address)
         self.nnames.append(nname)
         self.nparents.append(nparent)
         self.ntypes.append(ntype)
         self.nobjs.append(nobj)
 
+        if ntype == TAG_GROUP:
+            # Index group membership by node so lookups skip a scan of groups.
+            for member in dict.fromkeys(nobj.members):
+                self._member_groups.setdefault(member, []).append(address)
+            for controller in dict.fromkeys(nobj.controllers):
+                self._controller_groups.setdefault(controller, []).append(address)
+
     def __getitem__(self, val):
         """Navigate through the node tree. Can take names or IDs."""
-        try:
-            self.addresses.index(val)
+        if val in self._address_index:
             fun = self.get_by_id
-        except ValueError:
+        else:
             try:
                 self.nnames.index(val)
                 fun = self.get_by_name
@@ -589,9 +606,7 @@ class Nodes:
 
         |  address: Integer representing node/group/folder id.
         """
-        try:
-            i = self.addresses.index(address)
-        except ValueError:
+        if (i := self._address_index.get(address)) is None:
             return None
         return self.get_by_index(i)
 
@@ -611,8 +626,26 @@ class Nodes:
             self.nparents,
             self.nobjs,
             self.ntypes,
+            address_index=self._address_index,
         )
 
+    def groups_of(self, address, controller=True, responder=True):
+        """
+        Return the addresses of the groups (scenes) a node belongs to.
+
+        |  address: The node ID.
+        |  controller: Include the groups the node controls.
+        |  responder: Include the groups the node responds to.
+
+        Every controller is also a group member, so responder takes
+        precedence when both are requested.
+        """
+        if responder:
+            return list(self._member_groups.get(address, ()))
+        if controller:
+            return list(self._controller_groups.get(address, ()))
+        return []
+
     def get_folder(self, address):
         """Return the folder of a given node address."""
         parent = self.nparents[self.addresses.index(address)]
@@ -708,6 +741,8 @@ class NodeIterator:
 class NodeChangedEvent:
     """Class representation of a node change event."""
 
+    __slots__ = ("address", "action", "event_info")
+
     address: str
     action: str
     event_info: dict
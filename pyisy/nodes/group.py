@@ -1,5 +1,9 @@
 """Representation of groups (scenes) from an ISY."""
+import sys
+import weakref
+
 from ..constants import (
+    CMD_ON,
     FAMILY_GENERIC,
     INSTEON_STATELESS_NODEDEFID,
     ISY_VALUE_UNKNOWN,
@@ -9,6 +13,22 @@ from ..helpers import now
 from .nodebase import NodeBase
 
 
+def _member_callback(update_ref):
+    """Return a member event callback that doesn't keep the group alive."""
+
+    def _member_update(event):
+        if (update := update_ref()) is not None:
+            update(event)
+
+    return _member_update
+
+
+def _group_cleanup(handlers):
+    """Unsubscribe a collected group's member event handlers."""
+    for handler in handlers:
+        handler.unsubscribe()
+
+
 class Group(NodeBase):
     """
     Interact with ISY groups (scenes).
@@ -21,13 +41,21 @@ class Group(NodeBase):
     |  spoken: The string of the Notes Spoken field.
 
     :ivar has_children: Boolean value indicating that group has no children.
-    :ivar members: List of the members of this group.
-    :ivar controllers: List of the controllers of this group.
+    :ivar members: Tuple of the members of this group.
+    :ivar controllers: Tuple of the controllers of this group.
     :ivar name: The name of this group.
     :ivar status: Watched property indicating the status of the group.
     :ivar group_all_on: Watched property indicating if all devices in group are on.
     """
 
+    __slots__ = (
+        "_all_on",
+        "_members_handlers",
+        "_pin_node",
+        "controllers",
+        "members",
+    )
+
     def __init__(
         self,
         nodes,
@@ -41,31 +69,24 @@ class Group(NodeBase):
     ):
         """Initialize a Group class."""
         self._all_on = False
-        self._controllers = controllers or []
-        self._members = members or []
+        self._pin_node = None
+        self.controllers = tuple(sys.intern(c) for c in controllers or ())
+        self.members = tuple(sys.intern(m) for m in members or ())
         super().__init__(
             nodes, address, name, 0, family_id=family_id, pnode=pnode, flag=flag
         )
 
-        # listen for changes in children
+        # listen for changes in children, only weakly referencing the group so
+        # the finalizer (and the members) can't keep it alive
+        callback = _member_callback(weakref.WeakMethod(self._update))
         self._members_handlers = [
-            self._nodes[m].status_events.subscribe(self.update_callback)
-            for m in self.members
+            self._nodes[m].status_events.subscribe(callback) for m in self.members
         ]
+        weakref.finalize(self, _group_cleanup, list(self._members_handlers))
 
         # get and update the status
         self._update()
 
-    def __del__(self):
-        """Cleanup event handlers before deleting."""
-        for handler in self._members_handlers:
-            handler.unsubscribe()
-
-    @property
-    def controllers(self):
-        """Get the controller nodes of the scene/group."""
-        return self._controllers
-
     @property
     def group_all_on(self):
         """Return the current node state."""
@@ -81,16 +102,15 @@ class Group(NodeBase):
             self.status_events.notify(self._status)
         return self._all_on
 
-    @property
-    def members(self):
-        """Get the members of the scene/group."""
-        return self._members
-
     @property
     def protocol(self):
         """Return the protocol for this entity."""
         return PROTO_GROUP
 
+    async def turn_on(self, val=None):
+        """Turn the group on, passing any value through as given."""
+        return await self.send_cmd(CMD_ON, val)
+
     async def update(self, event=None, wait_time=0, xmldoc=None):
         """Update the group with values from the controller."""
         return self._update(event, wait_time, xmldoc)
@@ -98,18 +118,40 @@ class Group(NodeBase):
     def _update(self, event=None, wait_time=0, xmldoc=None):
         """Update the group with values from the controller."""
         self._last_update = now()
-        valid_nodes = [
-            node
-            for node in self.members
+        on_node = None
+        any_off = False
+
+        # Check the member that last kept the group on first, it usually still
+        # is. The node object is kept so this costs no address lookup.
+        if (
+            (pin := self._pin_node) is not None
+            and pin.status is not None
+            and pin.status != ISY_VALUE_UNKNOWN
+            and pin.status > 0
+        ):
+            on_node = pin
+
+        for address in self.members:
+            if on_node is not None and any_off:
+                # Both on and off members found, the group state is known.
+                break
+            node = self._nodes[address]
             if (
-                self._nodes[node].status is not None
-                and self._nodes[node].status != ISY_VALUE_UNKNOWN
-                and self._nodes[node].node_def_id not in INSTEON_STATELESS_NODEDEFID
-            )
-        ]
-        on_nodes = [node for node in valid_nodes if int(self._nodes[node].status) > 0]
-        if on_nodes:
-            self.group_all_on = len(on_nodes) == len(valid_nodes)
+                node is on_node
+                or node.status is None
+                or node.status == ISY_VALUE_UNKNOWN
+                or node.node_def_id in INSTEON_STATELESS_NODEDEFID
+            ):
+                continue
+            if node.status > 0:
+                if on_node is None:
+                    on_node = node
+            else:
+                any_off = True
+
+        self._pin_node = on_node
+        if on_node is not None:
+            self.group_all_on = not any_off
             self.status = 255
             return
         self.status = 0
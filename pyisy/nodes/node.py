@@ -1,7 +1,7 @@
 """Representation of a node from an ISY."""
 import asyncio
 from math import isnan
-from xml.dom import minidom
+from xml.etree import ElementTree
 
 from ..constants import (
     BACKLIGHT_SUPPORT,
@@ -27,11 +27,11 @@ from ..constants import (
     PROTO_INSTEON,
     PROTO_ZWAVE,
     TAG_CONFIG,
-    TAG_GROUP,
     TAG_PARAMETER,
     TAG_SIZE,
     TAG_VALUE,
     UOM_CLIMATE_MODES,
+    UOM_DOUBLE_TEMP,
     UOM_FAN_MODES,
     UOM_TO_STATES,
     URL_CONFIG,
@@ -44,17 +44,21 @@ from ..constants import (
     ZWAVE_CAT_LOCK,
     ZWAVE_CAT_THERMOSTAT,
 )
-from ..exceptions import XML_ERRORS, XML_PARSE_ERROR, ISYResponseParseError
+from ..exceptions import XML_PARSE_ERROR, ISYResponseParseError
 from ..helpers import (
+    CoalescedUpdate,
     EventEmitter,
     NodeProperty,
-    attr_from_xml,
     now,
+    parse_status_property,
     parse_xml_properties,
 )
 from ..logging import _LOGGER
 from .nodebase import NodeBase
 
+# Units of measure for which the ISY expects setpoints at twice the temperature.
+UOM_DOUBLE_TEMPS = frozenset((UOM_DOUBLE_TEMP, "degrees"))
+
 
 class Node(NodeBase):
     """
@@ -81,6 +85,25 @@ class Node(NodeBase):
     :ivar has_children: Property indicating that there are no more children.
     """
 
+    __slots__ = (
+        "_enabled",
+        "_formatted",
+        "_is_battery_node",
+        "_is_dimmable",
+        "_node_def_id",
+        "_node_server",
+        "_parent_node",
+        "_prec",
+        "_protocol",
+        "_status_url",
+        "_type",
+        "_uom",
+        "_uom_doubles",
+        "_updater",
+        "_zwave_props",
+        "control_events",
+    )
+
     def __init__(
         self,
         nodes,
@@ -109,6 +132,7 @@ class Node(NodeBase):
         self._protocol = protocol
         self._type = device_type
         self._uom = state.uom
+        self._updater = CoalescedUpdate(self._fetch_update)
         self._zwave_props = zwave_props
         self.control_events = EventEmitter()
         self._is_battery_node = not state_set
@@ -122,6 +146,10 @@ class Node(NodeBase):
             pnode=pnode,
             flag=flag,
         )
+        self._status_url = self.isy.conn.compile_url(
+            [URL_NODES, self._id, METHOD_GET, PROP_STATUS]
+        )
+        self._set_uom_flags()
 
     @property
     def dimmable(self):
@@ -174,12 +202,17 @@ class Node(NodeBase):
 
         Check ISYv4 UOM, then Insteon and Z-Wave Types for dimmable types.
         """
-        dimmable = (
+        return self._is_dimmable
+
+    def _set_uom_flags(self):
+        """Refresh the cached flags derived from the unit of measure."""
+        self._uom_doubles = isinstance(self._uom, str) and self._uom in UOM_DOUBLE_TEMPS
+        self._is_dimmable = bool(
             "%" in str(self._uom)
             or (
                 self._protocol == PROTO_INSTEON
                 and self.type
-                and any({self.type.startswith(t) for t in INSTEON_TYPE_DIMMABLE})
+                and self.type.startswith(tuple(INSTEON_TYPE_DIMMABLE))
                 and self._id.endswith(INSTEON_SUBNODE_DIMMABLE)
             )
             or (
@@ -188,7 +221,6 @@ class Node(NodeBase):
                 and self._zwave_props.category in ZWAVE_CAT_DIMMABLE
             )
         )
-        return dimmable
 
     @property
     def is_lock(self):
@@ -296,13 +328,16 @@ class Node(NodeBase):
             return False
 
         try:
-            parameter_dom = minidom.parseString(parameter_xml)
-        except XML_ERRORS as exc:
+            parameter_dom = ElementTree.fromstring(parameter_xml)
+        except ElementTree.ParseError as exc:
             _LOGGER.error("%s: Node Parameter %s", XML_PARSE_ERROR, parameter_xml)
             raise ISYResponseParseError() from exc
 
-        size = int(attr_from_xml(parameter_dom, TAG_CONFIG, TAG_SIZE))
-        value = attr_from_xml(parameter_dom, TAG_CONFIG, TAG_VALUE)
+        if (config := next(parameter_dom.iter(TAG_CONFIG), None)) is None:
+            _LOGGER.warning("Error fetching parameter from ISY")
+            return False
+        size = int(config.get(TAG_SIZE))
+        value = config.get(TAG_VALUE)
 
         # Add/update the aux_properties to include the parameter.
         node_prop = NodeProperty(
@@ -437,22 +472,35 @@ class Node(NodeBase):
 
     async def update(self, event=None, wait_time=0, xmldoc=None):
         """Update the value of the node from the controller."""
-        if not self.isy.auto_update and not xmldoc:
-            await asyncio.sleep(wait_time)
-            req_url = self.isy.conn.compile_url(
-                [URL_NODES, self._id, METHOD_GET, PROP_STATUS]
-            )
-            xml = await self.isy.conn.request(req_url)
-            try:
-                xmldoc = minidom.parseString(xml)
-            except XML_ERRORS as exc:
-                _LOGGER.error("%s: Nodes", XML_PARSE_ERROR)
-                raise ISYResponseParseError(XML_PARSE_ERROR) from exc
+        if not self.isy.auto_update and xmldoc is None:
+            # Share a status request that is still waiting to be sent.
+            return await self._updater.run(wait_time)
 
         if xmldoc is None:
             _LOGGER.warning("ISY could not update node: %s", self._id)
             return
 
+        self.update_from_xml(xmldoc)
+
+    async def _fetch_update(self):
+        """Fetch the status of the node from the controller and apply it."""
+        xml = await self.isy.conn.request(self._status_url)
+        if xml is None:
+            _LOGGER.warning("ISY could not update node: %s", self._id)
+            return
+        if (state := parse_status_property(xml)) is not None:
+            self.update_state(state)
+            _LOGGER.debug("ISY updated node: %s", self._id)
+            return
+        try:
+            xmldoc = ElementTree.fromstring(xml)
+        except ElementTree.ParseError as exc:
+            _LOGGER.error("%s: Nodes", XML_PARSE_ERROR)
+            raise ISYResponseParseError(XML_PARSE_ERROR) from exc
+        self.update_from_xml(xmldoc)
+
+    def update_from_xml(self, xmldoc):
+        """Update the state and aux properties from a node's status XML."""
         self._last_update = now()
         state, aux_props, _ = parse_xml_properties(xmldoc)
         self._aux_properties.update(aux_props)
@@ -473,6 +521,7 @@ class Node(NodeBase):
 
         if state.uom not in (self._uom, ""):
             self._uom = state.uom
+            self._set_uom_flags()
             changed = True
 
         if state.formatted != self._formatted:
@@ -490,14 +539,14 @@ class Node(NodeBase):
 
     def get_command_value(self, uom, cmd):
         """Check against the list of UOM States if this is a valid command."""
-        if cmd not in UOM_TO_STATES[uom].values():
+        value = next(
+            (key for key, state in UOM_TO_STATES[uom].items() if state == cmd), None
+        )
+        if value is None:
             _LOGGER.warning(
                 "Failed to call %s on %s, invalid command.", cmd, self.address
             )
-            return None
-        return list(UOM_TO_STATES[uom].keys())[
-            list(UOM_TO_STATES[uom].values()).index(cmd)
-        ]
+        return value
 
     def get_groups(self, controller=True, responder=True):
         """
@@ -507,16 +556,7 @@ class Node(NodeBase):
         If responder is True, then the scenes it is a responder of are added to
         the list.
         """
-        groups = []
-        for child in self._nodes.all_lower_nodes:
-            if child[0] == TAG_GROUP:
-                if responder:
-                    if self._id in self._nodes[child[2]].members:
-                        groups.append(child[2])
-                elif controller:
-                    if self._id in self._nodes[child[2]].controllers:
-                        groups.append(child[2])
-        return groups
+        return self._nodes.groups_of(self._id, controller, responder)
 
     def get_property_uom(self, prop):
         """Get the Unit of Measurement an aux property."""
@@ -584,10 +624,10 @@ class Node(NodeBase):
             )
             return
         # ISY wants 2 times the temperature for Insteon in order to not lose precision
-        if self._uom in ["101", "degrees"]:
+        if self._uom_doubles:
             val = 2 * val
         return await self.send_cmd(
-            setpoint_prop, str(val), self.get_property_uom(setpoint_prop)
+            setpoint_prop, val, self.get_property_uom(setpoint_prop)
         )
 
     async def set_fan_mode(self, cmd):
@@ -604,7 +644,7 @@ class Node(NodeBase):
                 "Invalid value for On Level for %s. Valid values are 0-255.", self._id
             )
             return False
-        return await self.send_cmd(PROP_ON_LEVEL, str(val))
+        return await self.send_cmd(PROP_ON_LEVEL, val)
 
     async def set_ramp_rate(self, val):
         """Set the Ramp Rate for a device."""
@@ -615,7 +655,7 @@ class Node(NodeBase):
                 self._id,
             )
             return False
-        return await self.send_cmd(PROP_RAMP_RATE, str(val))
+        return await self.send_cmd(PROP_RAMP_RATE, val)
 
     async def start_manual_dimming(self):
         """Begin manually dimming a device."""
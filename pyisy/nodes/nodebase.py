@@ -1,5 +1,7 @@
 """Base object for nodes and groups."""
+import sys
 from xml.dom import minidom
+from xml.parsers.expat import ExpatError
 
 from ..constants import (
     ATTR_LAST_CHANGED,
@@ -31,7 +33,7 @@ from ..constants import (
     URL_NOTES,
     XML_TRUE,
 )
-from ..exceptions import XML_ERRORS, XML_PARSE_ERROR, ISYResponseParseError
+from ..exceptions import XML_PARSE_ERROR, ISYResponseParseError
 from ..helpers import EventEmitter, NodeProperty, now, value_from_xml
 from ..logging import _LOGGER
 
@@ -39,6 +41,23 @@ from ..logging import _LOGGER
 class NodeBase:
     """Base Object for Nodes and Groups/Scenes."""
 
+    __slots__ = (
+        "__weakref__",
+        "_aux_properties",
+        "_family",
+        "_flag",
+        "_id",
+        "_last_changed",
+        "_last_update",
+        "_name",
+        "_nodes",
+        "_notes",
+        "_primary_node",
+        "_status",
+        "isy",
+        "status_events",
+    )
+
     has_children = False
 
     def __init__(
@@ -55,15 +74,14 @@ class NodeBase:
         """Initialize a Node Base class."""
         self._aux_properties = aux_properties if aux_properties is not None else {}
         self._family = NODE_FAMILY_ID.get(family_id)
-        self._id = address
+        self._id = sys.intern(address)
         self._name = name
         self._nodes = nodes
         self._notes = None
         self._primary_node = pnode
         self._flag = flag
         self._status = status
-        self._last_update = now()
-        self._last_changed = now()
+        self._last_update = self._last_changed = now()
         self.isy = nodes.isy
         self.status_events = EventEmitter()
 
@@ -185,8 +203,12 @@ class NodeBase:
         """Retrieve and parse the notes for a given node.
 
         Notes are not retrieved unless explicitly requested by
-        a call to this function.
+        a call to this function. Once retrieved they are kept until
+        invalidate_notes() is called; a failed request is not kept, so the
+        next call tries again. A copy is returned on each call.
         """
+        if self._notes is not None:
+            return dict(self._notes)
         notes_xml = await self.isy.conn.request(
             self.isy.conn.compile_url([URL_NODES, self._id, URL_NOTES]), ok404=True
         )
@@ -197,7 +219,7 @@ class NodeBase:
         if notes_xml is not None and notes_xml != "":
             try:
                 notes_dom = minidom.parseString(notes_xml)
-            except XML_ERRORS as exc:
+            except ExpatError as exc:
                 _LOGGER.error("%s: Node Notes %s", XML_PARSE_ERROR, notes_xml)
                 raise ISYResponseParseError() from exc
 
@@ -205,12 +227,20 @@ class NodeBase:
             location = value_from_xml(notes_dom, TAG_LOCATION)
             description = value_from_xml(notes_dom, TAG_DESCRIPTION)
             is_load = value_from_xml(notes_dom, TAG_IS_LOAD)
-        return {
+        notes = {
             TAG_SPOKEN: spoken,
             TAG_IS_LOAD: is_load == XML_TRUE,
             TAG_DESCRIPTION: description,
             TAG_LOCATION: location,
         }
+        if notes_xml is not None:
+            # An empty reply (404) means the node has no notes, keep that too.
+            self._notes = notes
+        return dict(notes)
+
+    def invalidate_notes(self):
+        """Discard the stored notes so the next get_notes() fetches them."""
+        self._notes = None
 
     async def update(self, event=None, wait_time=0, xmldoc=None):
         """Update the group with values from the controller."""
@@ -250,13 +280,13 @@ class NodeBase:
         """Send a command to the device."""
         value = str(val) if val is not None else None
         _uom = str(uom) if uom is not None else None
-        req = [URL_NODES, str(self._id), METHOD_COMMAND, cmd]
+        req = [URL_NODES, self._id, METHOD_COMMAND, cmd]
         if value:
             req.append(value)
         if _uom:
             req.append(_uom)
-        req_url = self.isy.conn.compile_url(req, query)
-        if not await self.isy.conn.request(req_url):
+        conn = self.isy.conn
+        if not await conn.request(conn.compile_url(req, query)):
             _LOGGER.warning(
                 "ISY could not send %s command to %s.",
                 COMMAND_FRIENDLY_NAME.get(cmd),
@@ -332,11 +362,11 @@ class NodeBase:
 
         |  [optional] val: The value brightness value (0-255) for the node.
         """
-        if val is None or type(self).__name__ == "Group":
+        if val is None:
             cmd = CMD_ON
-        elif int(val) > 0:
+        elif (val := int(val)) > 0:
             cmd = CMD_ON
-            val = str(val) if int(val) <= 255 else None
+            val = val if val <= 255 else None
         else:
             cmd = CMD_OFF
             val = None
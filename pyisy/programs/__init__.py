@@ -13,17 +13,17 @@ from ..constants import (
     TAG_FOLDER,
     TAG_NAME,
     TAG_PRGM_FINISH,
+    TAG_PRGM_OFF,
+    TAG_PRGM_ON,
     TAG_PRGM_RUN,
     TAG_PRGM_RUNNING,
     TAG_PRGM_STATUS,
     TAG_PROGRAM,
     UPDATE_INTERVAL,
-    XML_OFF,
-    XML_ON,
     XML_TRUE,
 )
 from ..exceptions import XML_ERRORS, XML_PARSE_ERROR
-from ..helpers import attr_from_element, now, value_from_xml
+from ..helpers import CoalescedUpdate, attr_from_element, now, value_from_xml
 from ..logging import _LOGGER
 from ..nodes import NodeIterator as ProgramIterator
 from .folder import Folder
@@ -77,6 +77,9 @@ class Programs:
         self.pparents = []
         self.pobjs = []
         self.ptypes = []
+        self._refresh_tasks = set()
+        self._update_addresses = set()
+        self._updater = CoalescedUpdate(self._fetch_update)
 
         if xml is not None:
             self.parse(xml)
@@ -147,7 +150,6 @@ class Programs:
     def update_received(self, xmldoc):
         """Update programs from EventStream message."""
         # pylint: disable=attribute-defined-outside-init
-        xml = xmldoc.toxml()
         address = value_from_xml(xmldoc, ATTR_ID).zfill(4)
         try:
             pobj = self.get_by_id(address).leaf
@@ -162,7 +164,7 @@ class Programs:
 
         new_status = False
 
-        if f"<{TAG_PRGM_STATUS}>" in xml:
+        if xmldoc.getElementsByTagName(TAG_PRGM_STATUS):
             status = value_from_xml(xmldoc, TAG_PRGM_STATUS)
             if status == "21":
                 pobj.ran_then += 1
@@ -170,14 +172,16 @@ class Programs:
             elif status == "31":
                 pobj.ran_else += 1
 
-        if f"<{TAG_PRGM_RUN}>" in xml:
+        if xmldoc.getElementsByTagName(TAG_PRGM_RUN):
             pobj.last_run = parser.parse(value_from_xml(xmldoc, TAG_PRGM_RUN))
 
-        if f"<{TAG_PRGM_FINISH}>" in xml:
+        if xmldoc.getElementsByTagName(TAG_PRGM_FINISH):
             pobj.last_finished = parser.parse(value_from_xml(xmldoc, TAG_PRGM_FINISH))
 
-        if XML_ON in xml or XML_OFF in xml:
-            pobj.enabled = XML_ON in xml
+        if xmldoc.getElementsByTagName(TAG_PRGM_ON):
+            pobj.enabled = True
+        elif xmldoc.getElementsByTagName(TAG_PRGM_OFF):
+            pobj.enabled = False
 
         # Update Status last and make sure the change event fires, but only once.
         if pobj.status != new_status:
@@ -258,7 +262,7 @@ class Programs:
                 self.insert(address, pname, pparent, pobj, ptype)
             else:
                 pobj = self.get_by_id(address).leaf
-                asyncio.create_task(pobj.update(data=data))
+                pobj.update_from_data(data)
 
         _LOGGER.info("ISY Loaded/Updated Programs")
 
@@ -266,10 +270,40 @@ class Programs:
         """
         Update the status of the programs and folders.
 
+        |  wait_time: How long to wait before updating.
+        |  address: The program ID to update.
+
+        Calls made while an update is still waiting are folded into it, so
+        a burst of refreshes costs a single request.
+        """
+        if not self._updater.pending:
+            self._update_addresses = set()
+        self._update_addresses.add(address)
+        await self._updater.run(wait_time)
+
+    def schedule_update(self, wait_time=UPDATE_INTERVAL, address=None):
+        """
+        Start an update in the background and return without waiting for it.
+
         |  wait_time: How long to wait before updating.
         |  address: The program ID to update.
         """
-        await asyncio.sleep(wait_time)
+        task = asyncio.create_task(self.update(wait_time, address=address))
+        # Keep a reference until it finishes so the task can't be collected.
+        self._refresh_tasks.add(task)
+        task.add_done_callback(self._refresh_done)
+
+    def _refresh_done(self, task):
+        """Release a finished background update and log its failure."""
+        self._refresh_tasks.discard(task)
+        if not task.cancelled() and (exc := task.exception()) is not None:
+            _LOGGER.error("ISY could not update programs: %s", exc)
+
+    async def _fetch_update(self):
+        """Fetch the pending program updates in one request."""
+        addresses = self._update_addresses
+        # Refresh one program directly; several are cheaper as one full list.
+        address = addresses.pop() if len(addresses) == 1 else None
         xml = await self.isy.conn.get_programs(address)
 
         if xml is not None:
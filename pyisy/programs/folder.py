@@ -1,4 +1,5 @@
 """ISY Program Folders."""
+
 from ..constants import (
     ATTR_LAST_CHANGED,
     ATTR_LAST_UPDATE,
@@ -37,6 +38,7 @@ class Folder:
 
     def __init__(self, programs, address, pname, pstatus, plastup):
         """Initialize the Folder class."""
+        self._cmd_urls = {}
         self._id = address
         self._last_update = plastup
         self._last_changed = now()
@@ -125,21 +127,40 @@ class Folder:
         |  wait_time: [optional] Seconds to wait before updating.
         """
         if data is not None:
-            self._last_changed = now()
-            self.status = data["pstatus"]
+            self.update_from_data(data)
             return
         await self._programs.update(wait_time=wait_time, address=self._id)
 
+    def update_from_data(self, data):
+        """Update the folder with values parsed from the controller."""
+        self._last_update = data["plastup"]
+        if self._status == data["pstatus"]:
+            # Nothing but the poll time changed.
+            return
+        self._last_changed = now()
+        self.status = data["pstatus"]
+
     async def send_cmd(self, command):
-        """Run the appropriate clause of the object."""
-        req_url = self.isy.conn.compile_url([URL_PROGRAMS, str(self._id), command])
+        """
+        Run the appropriate clause of the object.
+
+        Without auto_update, a refresh of this program is scheduled after the
+        command; it runs in the background, so the returned value does not
+        wait for the refreshed state.
+        """
+        req_url = self._cmd_urls.get(command)
+        if req_url is None:
+            req_url = self._cmd_urls[command] = self.isy.conn.compile_url(
+                [URL_PROGRAMS, str(self._id), command]
+            )
         result = await self.isy.conn.request(req_url)
         if not result:
             _LOGGER.warning('ISY could not call "%s" on program: %s', command, self._id)
             return False
         _LOGGER.debug('ISY ran "%s" on program: %s', command, self._id)
         if not self.isy.auto_update:
-            await self.update()
+            # Refresh once the ISY has settled without holding up the caller.
+            self._programs.schedule_update(address=self._id)
         return True
 
     async def enable(self):
@@ -150,21 +150,36 @@ class Program(Folder):
         |  data: [optional] Data to update the object with.
         """
         if data is not None:
-            self._enabled = data["penabled"]
-            self._last_finished = data["plastfin"]
-            self._last_run = data["plastrun"]
-            self._last_update = data["plastup"]
-            self._run_at_startup = data["pstartrun"]
-            self._running = (data["plastrun"] >= data["plastup"]) or data["prunning"]
-            # Update Status last and make sure the change event fires, but only once.
-            if self.status != data["pstatus"]:
-                self.status = data["pstatus"]
-            else:
-                # Status didn't change, but something did, so fire the event.
-                self.status_events.notify(self.status)
+            self.update_from_data(data)
             return
         await self._programs.update(wait_time, address=self._id)
 
+    def update_from_data(self, data):
+        """Update the program with values parsed from the controller."""
+        running = (data["plastrun"] >= data["plastup"]) or data["prunning"]
+        self._last_update = data["plastup"]
+        if (
+            self._status == data["pstatus"]
+            and self._running == running
+            and self._enabled == data["penabled"]
+            and self._run_at_startup == data["pstartrun"]
+            and self._last_run == data["plastrun"]
+            and self._last_finished == data["plastfin"]
+        ):
+            # Nothing but the poll time changed, skip the change event.
+            return
+        self._enabled = data["penabled"]
+        self._last_finished = data["plastfin"]
+        self._last_run = data["plastrun"]
+        self._run_at_startup = data["pstartrun"]
+        self._running = running
+        # Update Status last and make sure the change event fires, but only once.
+        if self.status != data["pstatus"]:
+            self.status = data["pstatus"]
+        else:
+            # Status didn't change, but something did, so fire the event.
+            self.status_events.notify(self.status)
+
     async def enable_run_at_startup(self):
         """Send command to the program to enable it to run at startup."""
         return await self.send_cmd(CMD_ENABLE_RUN_AT_STARTUP)
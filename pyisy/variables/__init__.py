@@ -1,6 +1,7 @@
 """ISY Variables."""
-from asyncio import sleep
-from xml.dom import minidom
+from datetime import datetime
+from functools import lru_cache
+from xml.etree import ElementTree
 
 from dateutil import parser
 
@@ -15,8 +16,8 @@ from ..constants import (
     TAG_TYPE,
     TAG_VARIABLE,
 )
-from ..exceptions import XML_ERRORS, XML_PARSE_ERROR, ISYResponseParseError
-from ..helpers import attr_from_element, attr_from_xml, now, value_from_xml
+from ..exceptions import XML_PARSE_ERROR, ISYResponseParseError
+from ..helpers import CoalescedUpdate, attr_from_xml, now, value_from_xml
 from ..logging import _LOGGER
 from .variable import Variable
 
@@ -27,6 +28,19 @@ EMPTY_VARIABLE_RESPONSES = [
 ]
 
 
+@lru_cache(maxsize=256)
+def parse_timestamp(ts_raw):
+    """Parse a variable timestamp, e.g. 20240131 23:59:59."""
+    if len(ts_raw) == 17 and ts_raw[8] == " ":
+        try:
+            return datetime.fromisoformat(
+                f"{ts_raw[0:4]}-{ts_raw[4:6]}-{ts_raw[6:8]}T{ts_raw[9:]}"
+            )
+        except ValueError:
+            pass
+    return parser.parse(ts_raw)
+
+
 class Variables:
     """
     This class handles the ISY variables.
@@ -42,6 +56,8 @@ class Variables:
     |  vnames: List of variable names form the controller.
     |  vobjs: List of variable objects.
     |  xml: XML string from the controller detailing the device's variables.
+    |  vname_ids: [keyword only] Map of variable names to IDs, per variable
+                  type, shared with the per-type views.
 
     :ivar children: List of the children below the current level of navigation.
     """
@@ -55,6 +71,8 @@ class Variables:
         vobjs=None,
         def_xml=None,
         var_xml=None,
+        *,
+        vname_ids=None,
     ):
         """Initialize a Variables ISY Variable Manager class."""
         self.isy = isy
@@ -63,11 +81,15 @@ class Variables:
         self.vids = {1: [], 2: []}
         self.vobjs = {1: {}, 2: {}}
         self.vnames = {1: {}, 2: {}}
+        self._vname_ids = {1: {}, 2: {}}
+        self._updater = CoalescedUpdate(self._fetch_update)
 
         if vids is not None and vnames is not None and vobjs is not None:
             self.vids = vids
             self.vnames = vnames
             self.vobjs = vobjs
+            if vname_ids is not None:
+                self._vname_ids = vname_ids
             return
 
         valid_definitions = False
@@ -103,35 +125,36 @@ class Variables:
                 _LOGGER.info("No Type %s variables defined", ind + 1)
                 continue
             try:
-                xmldoc = minidom.parseString(xmls[ind])
-            except XML_ERRORS:
+                xmldoc = ElementTree.fromstring(xmls[ind])
+            except ElementTree.ParseError:
                 _LOGGER.error("%s: Type %s Variables", XML_PARSE_ERROR, ind + 1)
                 continue
-            else:
-                features = xmldoc.getElementsByTagName(TAG_VARIABLE)
-                for feature in features:
-                    vid = int(attr_from_element(feature, ATTR_ID))
-                    self.vnames[ind + 1][vid] = attr_from_element(feature, TAG_NAME)
-                valid_definitions = True
+            vnames = self.vnames[ind + 1]
+            vname_ids = self._vname_ids[ind + 1]
+            for feature in xmldoc.iter(TAG_VARIABLE):
+                vid = int(feature.get(ATTR_ID))
+                vname = feature.get(TAG_NAME)
+                vnames[vid] = vname
+                vname_ids.setdefault(vname, vid)
+            valid_definitions = True
         return valid_definitions
 
     def parse(self, xml):
         """Parse XML from the controller with details about the variables."""
         try:
-            xmldoc = minidom.parseString(xml)
-        except XML_ERRORS as exc:
+            xmldoc = ElementTree.fromstring(xml)
+        except ElementTree.ParseError as exc:
             _LOGGER.error("%s: Variables", XML_PARSE_ERROR)
             raise ISYResponseParseError(XML_PARSE_ERROR) from exc
 
-        features = xmldoc.getElementsByTagName(ATTR_VAR)
-        for feature in features:
-            vid = int(attr_from_element(feature, ATTR_ID))
-            vtype = int(attr_from_element(feature, TAG_TYPE))
-            init = value_from_xml(feature, ATTR_INIT)
-            prec = int(value_from_xml(feature, ATTR_PRECISION, 0))
-            val = value_from_xml(feature, ATTR_VAL)
-            ts_raw = value_from_xml(feature, ATTR_TS)
-            timestamp = parser.parse(ts_raw)
+        for feature in xmldoc.iter(ATTR_VAR):
+            vid = int(feature.get(ATTR_ID))
+            vtype = int(feature.get(TAG_TYPE))
+            init = feature.findtext(ATTR_INIT) or None
+            prec = int(feature.findtext(ATTR_PRECISION) or 0)
+            val = feature.findtext(ATTR_VAL) or None
+            ts_raw = feature.findtext(ATTR_TS)
+            timestamp = parse_timestamp(ts_raw)
             vname = self.vnames[vtype].get(vid, "")
 
             vobj = self.vobjs[vtype].get(vid)
@@ -152,8 +175,13 @@ class Variables:
         Update the variable objects with data from the controller.
 
         |  wait_time: Seconds to wait before updating.
+
+        Calls made while an update is still waiting share its request.
         """
-        await sleep(wait_time)
+        await self._updater.run(wait_time)
+
+    async def _fetch_update(self):
+        """Fetch and parse the current variable values."""
         xml = await self.isy.conn.get_variables()
         if xml is not None:
             self.parse(xml)
@@ -162,7 +190,6 @@ class Variables:
 
     def update_received(self, xmldoc):
         """Process an update received from the event stream."""
-        xml = xmldoc.toxml()
         vtype = int(attr_from_xml(xmldoc, ATTR_VAR, TAG_TYPE))
         vid = int(attr_from_xml(xmldoc, ATTR_VAR, ATTR_ID))
         try:
@@ -171,12 +198,12 @@ class Variables:
             return  # this is a new variable that hasn't been loaded
 
         vobj.last_update = now()
-        if f"<{ATTR_INIT}>" in xml:
+        if xmldoc.getElementsByTagName(ATTR_INIT):
             vobj.init = int(value_from_xml(xmldoc, ATTR_INIT))
         else:
             vobj.status = int(value_from_xml(xmldoc, ATTR_VAL))
             vobj.prec = int(value_from_xml(xmldoc, ATTR_PRECISION, 0))
-            vobj.last_edited = parser.parse(value_from_xml(xmldoc, ATTR_TS))
+            vobj.last_edited = parse_timestamp(value_from_xml(xmldoc, ATTR_TS))
 
         _LOGGER.debug("ISY Updated Variable: %s.%s", str(vtype), str(vid))
 
@@ -188,7 +215,14 @@ class Variables:
         """
         if self.root is None:
             if val in [1, 2]:
-                return Variables(self.isy, val, self.vids, self.vnames, self.vobjs)
+                return Variables(
+                    self.isy,
+                    val,
+                    self.vids,
+                    self.vnames,
+                    self.vobjs,
+                    vname_ids=self._vname_ids,
+                )
             raise KeyError(f"Unknown variable type: {val}")
         if isinstance(val, int):
             try:
@@ -196,10 +230,10 @@ class Variables:
             except (ValueError, KeyError) as err:
                 raise KeyError(f"Unrecognized variable id: {val}") from err
 
-        for vid, vname in self.vnames[self.root]:
-            if vname == val:
-                return self.vobjs[self.root][vid]
-        raise KeyError(f"Unrecognized variable name: {val}")
+        try:
+            return self.vobjs[self.root][self._vname_ids[self.root][val]]
+        except KeyError as err:
+            raise KeyError(f"Unrecognized variable name: {val}") from err
 
     def __setitem__(self, val, value):
         """Handle the setitem function for the Class."""
@@ -211,10 +245,10 @@ class Variables:
 
         |  val: The name of the variable to look for.
         """
-        vtype, _, vid = next(item for item in self.children if val in item)
-        if not vid and vtype:
-            raise KeyError(f"Unrecognized variable name: {val}")
-        return self.vobjs[vtype].get(vid)
+        for vtype in (1, 2) if self.root is None else (self.root,):
+            if (vid := self._vname_ids[vtype].get(val)) is not None:
+                return self.vobjs[vtype].get(vid)
+        raise KeyError(f"Unrecognized variable name: {val}")
 
     @property
     def children(self):
@@ -224,14 +258,8 @@ class Variables:
         else:
             types = [self.root]
 
-        out = []
-        for vtype in types:
-            for ind in range(len(self.vids[vtype])):
-                out.append(
-                    (
-                        vtype,
-                        self.vnames[vtype].get(self.vids[vtype][ind], ""),
-                        self.vids[vtype][ind],
-                    )
-                )
-        return out
+        return [
+            (vtype, self.vnames[vtype].get(vid, ""), vid)
+            for vtype in types
+            for vid in self.vids[vtype]
+        ]